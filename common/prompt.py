@@ -2,7 +2,9 @@ import argparse
 import requests
 import json
 
+from requests.adapters import HTTPAdapter
 from requests.exceptions import InvalidURL
+from urllib3.util.retry import Retry
 
 # === HELPERS ======================================================================================
 bcolor_dict = {
@@ -22,21 +24,23 @@ def bcolor(key, string):
 
 
 # === COMMON FUNCTIONS =============================================================================
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.1)))
+
 def verbose_print(payload, response):
     print("=== Payload ===")
     print(json.dumps(payload, indent=4))
     print("=== Response ===")
     print(json.dumps(response.json(), indent=4))
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 def get_headers(cli_args):
-    return {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {cli_args.token}"
-    }
+    return {**_JSON_HEADERS, "Authorization": f"Bearer {cli_args.token}"}
 
 
 # === COMPLETIONS ENDPOINT =========================================================================
-def completions(cli_args):
+def completions(cli_args, headers):
     payload = {
         "model": cli_args.model,
         "prompt": cli_args.message,
@@ -44,7 +48,7 @@ def completions(cli_args):
         "max_tokens": cli_args.max_tokens,
     }
     try:
-        response = requests.post(cli_args.url, headers=get_headers(cli_args), json=payload)
+        response = session.post(cli_args.url, headers=headers, json=payload)
     except requests.exceptions.RequestException as e:
         print("ERROR")
         raise e
@@ -63,7 +67,7 @@ def completions(cli_args):
 
 
 # === CHAT ENDPOINT =========================================================================
-def chat_completions(cli_args):
+def chat_completions(cli_args, headers):
     payload = {
         "model": cli_args.model,
         "messages": [{"role": "user", "content": cli_args.message}],
@@ -71,7 +75,7 @@ def chat_completions(cli_args):
         "max_tokens":cli_args.max_tokens,
     }
     try:
-        response = requests.post(cli_args.url, headers=get_headers(cli_args), json=payload)
+        response = session.post(cli_args.url, headers=headers, json=payload)
     except requests.exceptions.RequestException as e:
         print("ERROR")
         raise e
@@ -90,22 +94,18 @@ def chat_completions(cli_args):
             for warning in response_json["warnings"]:
                 print(bcolor("YELLOW", f"Warning: {warning['message']}"))
 
-            message_detections = {}
             for detection_schema, detections_of_that_schema in response_json["detections"].items():
                 if detections_of_that_schema is None:
                     continue
 
-                print(bcolor("YELLOW", f"{detection_schema.title()} Detections:"))
-                detection_idx = 0
-                for msg_idx, detections in enumerate(detections_of_that_schema):
-                    for detection in detections['results']:
-                        if msg_idx not in message_detections:
-                            message_detections[msg_idx] = {}
-                        if detection_schema not in message_detections[msg_idx]:
-                            message_detections[msg_idx][detection_schema] = []
-                        print(bcolor("YELLOW",
-                                     f"   {detection_idx}) The {detection['detector_id']} flagged the following text as {detection['detection_type']}: \"{bcolor('UNDERLINE', detection['text'])}\""))
-                        detection_idx += 1
+                flagged = [detection for detections in detections_of_that_schema for detection in detections['results']]
+                lines = [bcolor("YELLOW", f"{detection_schema.title()} Detections:")]
+                lines.extend(
+                    bcolor("YELLOW",
+                           f"   {detection_idx}) The {detection['detector_id']} flagged the following text as {detection['detection_type']}: \"{bcolor('UNDERLINE', detection['text'])}\"")
+                    for detection_idx, detection in enumerate(flagged)
+                )
+                print("\n".join(lines))
         elif response_json["choices"]:
             print(bcolor("GREEN", response_json["choices"][0]["message"]["content"].strip()))
 
@@ -123,11 +123,12 @@ if __name__ == "__main__":
     parser.add_argument("--verbose", action="store_true")
 
     args = parser.parse_args()
+    headers = get_headers(args)
 
     if args.url.endswith("v1/chat/completions"):
-        chat_completions(args)
+        chat_completions(args, headers)
     elif args.url.endswith("v1/completions"):
-        completions(args)
+        completions(args, headers)
     else:
         msg = (f"URL must end in either {bcolor('GREEN', 'v1/completions')}"
                          f" or {bcolor('GREEN', 'v1/chat/completions:')},"
@@ -1,7 +1,12 @@
-import re
+import hashlib
 import requests
 import logging
+import threading
+import time
 import urllib3
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logger = logging.getLogger(__name__)
 
@@ -30,12 +35,19 @@ OUTPUT_POLICIES = [
 ]
 FORBIDDEN_WORDS = ["Chevrolet", "Dodge", "Ford", "Pontiac", "Oldsmobile", "Saturn", "Mercury", "Buick"]
 MAX_PROMPT_LENGTH = 256
+RESPONSE_CACHE_SIZE = 4096  # self-reflection verdicts kept in memory (temperature=0, so deterministic)
+RESPONSE_CACHE_TTL = 300    # seconds before a cached verdict is re-checked against the model
 
 # === TURN POLICY LIST INTO PROMPTS ================================================================
+# Built once at import. Policies are numbered from 1, matching the "POLICY: $IDX" index that
+# _process_guard_response maps back to the policy list.
+def _numbered_policies(policies):
+    return "\n".join(f"{i}) {policy}" for i, policy in enumerate(policies, start=1))
+
 INPUT_SYSTEM_PROMPT = """Your task is to check if the user message below complies with the company policy for talking with the company bot.
 
 Company policy for the user messages:
-"""+"\n".join([f"{i+1}) {policy}" for i, policy in enumerate(INPUT_POLICIES)])+"""
+"""+_numbered_policies(INPUT_POLICIES)+"""
 
 Should the message be blocked? If no, return "NO!". If yes, return "POLICY: $IDX!"
 """
@@ -43,12 +55,21 @@ Should the message be blocked? If no, return "NO!". If yes, return "POLICY: $IDX
 OUTPUT_SYSTEM_PROMPT = """Your task is to check if the bot message below complies with the company policy.
 
 Company policy for the bot:
-"""+"\n".join(f"{i}) {policy}" for i, policy in enumerate(OUTPUT_POLICIES))+"""
+"""+_numbered_policies(OUTPUT_POLICIES)+"""
 
 Should the message be blocked? If no, return "NO!". If yes, return "POLICY: $IDX!".
 """
 
 
+# === MODEL CONNECTION =============================================================================
+# one pooled keep-alive session, so each guardrail check doesn't pay for a new TCP/TLS handshake
+_session = requests.Session()
+_session.verify = False
+_adapter = HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.1))
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+
 # === HELPER FUNCTIONS =============================================================================
 def _build_response(text, message, detection_type):
     """Build the expected payload for the /detectors API"""
@@ -61,7 +82,30 @@ def _build_response(text, message, detection_type):
         "score": 1.0
     }
 
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
 def _chat_completion_to_model(user_prompt, system_prompt, headers, tokens=10):
+    """Send a chat-completion to the model, reusing the verdict for previously seen prompts"""
+    # whitespace-only differences (e.g. repeated checks of a debounced UI field) share a verdict
+    normalized = " ".join(user_prompt.split())
+    key = (system_prompt, hashlib.sha256(normalized.encode()).digest(), tokens)
+    now = time.monotonic()
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _response_cache.move_to_end(key)
+            return entry[1]
+
+    response = _request_chat_completion(user_prompt, system_prompt, headers, tokens)
+    with _response_cache_lock:
+        _response_cache[key] = (now + RESPONSE_CACHE_TTL, response)
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return response
+
+def _request_chat_completion(user_prompt, system_prompt, headers, tokens=10):
     """Send a chat-completion to the model"""
     payload = {
         "model": MODEL_NAME,
@@ -70,21 +114,27 @@ def _chat_completion_to_model(user_prompt, system_prompt, headers, tokens=10):
             {"content": user_prompt, "role": "user"}
         ],
         "stop": "!", # stop generation as soon as the expected pattern is finished
+        "max_tokens": tokens, # ...and bound it if the model never emits the "!"
         "temperature": 0
     }
-    response = requests.post(MODEL_URL, json=payload, verify=False,
-                             headers=headers)
+    response = _session.post(MODEL_URL, json=payload, headers=headers)
     if response.status_code != 200:
         raise RuntimeError(response.text)
-    return response.json()["choices"][0]['message']['content'].replace("[","")
+    # normalize once here (drop stray "[" and surrounding whitespace) so callers compare directly
+    return response.json()["choices"][0]['message']['content'].replace("[","").strip()
+
+def _violated_policy_index(response):
+    """Return the index N from a "POLICY: N" response, or None if there isn't one"""
+    _, found, rest = response.partition("POLICY:")
+    rest = rest.lstrip()
+    digits = rest[:len(rest) - len(rest.lstrip("0123456789"))]
+    return int(digits) if found and digits else None
 
 def _process_guard_response(response, policies, prefix):
     """Parse the model response to extract the expected response format"""
-    match = re.search(r"POLICY:\s*(\d+)", response)
-    if match:
-        response_idx = int(match.group(1)) - 1
-        if 0 <= response_idx < len(policies):
-            return f"{prefix} Policy Violation: {policies[response_idx]}"
+    policy_idx = _violated_policy_index(response)
+    if policy_idx is not None and 1 <= policy_idx <= len(policies):
+        return f"{prefix} Policy Violation: {policies[policy_idx - 1]}"
     return f"{prefix} Policy Violation"
 
 
@@ -104,6 +154,10 @@ def _prompt_too_long(text: str) -> bool:
 
 # === DEFINE THE GUARDRAILING FUNCTIONS  ===========================================================
 def input_guardrail(text: str, headers: dict) -> dict:
+    # nothing to judge in an empty or whitespace-only message; skip the model call
+    if not text or text.isspace():
+        return {}
+
     # first, see if the prompt is longer than the allowed prompt length
     if _prompt_too_long(text):
         return _build_response(
@@ -123,13 +177,13 @@ def input_guardrail(text: str, headers: dict) -> dict:
 
     # if the above both pass, use self-reflection to evaluate the prompt against the INPUT POLICIES
     response = _chat_completion_to_model(text, INPUT_SYSTEM_PROMPT, headers)
-    logger.info(f"INPUT GUARDRAIL | User message: `{text}`, self-reflection response: `{response}`")
+    logger.info("INPUT GUARDRAIL | User message: `%s`, self-reflection response: `%s`", text, response)
 
     # Expected response format:
     #  - if no policies violated: "NO"
     #  - if some policy violated: "POLICY: $VIOLATED_POLICY_INDEX"
 
-    if response.strip() == 'NO':
+    if response == 'NO':
         return {} # return an empty dict to report NO DETECTION
     else:
         # otherwise, parse the response to identify which policy was violated, and return the detection
@@ -141,11 +195,14 @@ def input_guardrail(text: str, headers: dict) -> dict:
 
 
 def output_guardrail(text: str, headers: dict) -> dict:
+    if not text or text.isspace():
+        return {}
+
     response = _chat_completion_to_model(text, OUTPUT_SYSTEM_PROMPT, headers)
-    logger.info(f"OUTPUT GUARDRAIL | Model output: `{text}`, self-reflection response: `{response}`")
+    logger.info("OUTPUT GUARDRAIL | Model output: `%s`, self-reflection response: `%s`", text, response)
 
     # same logic as above
-    if response.strip() == 'NO':
+    if response == 'NO':
         return {}
     else:
         return _build_response(
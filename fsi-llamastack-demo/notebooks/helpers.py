@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 from datetime import datetime
+from functools import lru_cache
 from IPython.display import display, HTML
 import pickle as pkl
 
@@ -375,6 +376,12 @@ bcolor_dict = {
 def bcolor(key, string):
     return bcolor_dict[key.upper()] + string + bcolor_dict['ENDC']
 
+@lru_cache(maxsize=None)
+def _probe_category(probe_name):
+    """Extract category from probe name (e.g., "encoding.InjectAscii85" -> "encoding")"""
+    category, sep, _ = probe_name.partition('.')
+    return category if sep else 'Other'
+
 def visualize_garak_results(garak_report):
     """
     Visualize NVIDIA Garak security evaluation results
@@ -403,8 +410,7 @@ def visualize_garak_results(garak_report):
         total = 1
         passed = total - failed
 
-        # Extract category from probe name (e.g., "encoding.InjectAscii85" -> "encoding")
-        category = probe_name.split('.')[0] if '.' in probe_name else 'Other'
+        category = _probe_category(probe_name)
 
         results.append({
             'Probe': probe_name,
@@ -573,7 +579,7 @@ def compare_garak_scans(protected_report, baseline_label="Without Guardrails", p
         system_failed = int(entry['vulnerable'])
         system_passed = 1-system_failed
 
-        category = probe_name.split('.')[0] if '.' in probe_name else 'Other'
+        category = _probe_category(probe_name)
 
 
         results.append({
@@ -27,6 +27,9 @@ def __getattr__(name: str):
     if name == "IntentsModelConfig":
         from .config import IntentsModelConfig
         return IntentsModelConfig
+    if name in ("DetectorOptions", "ProbeOptions", "BuffOptions", "HarnessOptions"):
+        from . import config
+        return getattr(config, name)
     if name == "GarakError":
         from .errors import GarakError
         return GarakError
@@ -37,10 +40,14 @@ __all__ = [
     "EvalConfig",
     "BenchmarkConfig",
     "BenchmarkRegistry",
+    "BuffOptions",
+    "DetectorOptions",
+    "HarnessOptions",
     "IntentsModelConfig",
     "PREDEFINED_BENCHMARKS",
     "KubeflowConfig",
     "ModelConfig",
+    "ProbeOptions",
     "PipelineRunner",
     "ScanJob",
     "GarakError",
@@ -1,7 +1,10 @@
 """Configuration for standalone Garak KFP pipeline"""
 
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from pydantic_settings import BaseSettings
 
 from llama_stack_provider_trustyai_garak.constants import (
@@ -11,6 +14,37 @@ from llama_stack_provider_trustyai_garak.constants import (
     DEFAULT_SDG_NUM_SAMPLES,
 )
 
+# Load .env into os.environ once; settings classes then read the environment
+# directly instead of re-parsing the file on every instantiation.
+load_dotenv(".env", override=False)
+
+
+class PluginOptions(BaseModel):
+    """Base for garak plugin option blobs.
+
+    Mirrors garak's ``*_options`` JSON, which is keyed by plugin module and
+    class (e.g. ``{"judge": {"Refusal": {...}}}``), so every key is kept as
+    an extra and nothing is declared or validated here.
+    """
+
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+class DetectorOptions(PluginOptions):
+    """Detector plugin options, shaped like garak's ``--detector_options``."""
+
+
+class ProbeOptions(PluginOptions):
+    """Probe plugin options, shaped like garak's ``--probe_options``."""
+
+
+class BuffOptions(PluginOptions):
+    """Buff plugin options, shaped like garak's ``--buff_options``."""
+
+
+class HarnessOptions(PluginOptions):
+    """Harness plugin options, shaped like garak's ``--harness_options``."""
+
 
 class BenchmarkConfig(BaseModel):
     """Configuration for a Garak benchmark.
@@ -77,11 +111,11 @@ class BenchmarkConfig(BaseModel):
     seed: Optional[int] = Field(default=None, description="Random seed for reproducible results")
     detectors: Optional[List[str]] = Field(default=None, description="Specific detectors to use")
     extended_detectors: Optional[List[str]] = Field(default=None, description="Additional detectors")
-    detector_options: Optional[Dict[str, Any]] = Field(default=None, description="Detector options")
-    probe_options: Optional[Dict[str, Any]] = Field(default=None, description="Probe options")
+    detector_options: Optional[DetectorOptions] = Field(default=None, description="Detector options")
+    probe_options: Optional[ProbeOptions] = Field(default=None, description="Probe options")
     buffs: Optional[List[str]] = Field(default=None, description="Input transformation buffs")
-    buff_options: Optional[Dict[str, Any]] = Field(default=None, description="Buff options")
-    harness_options: Optional[Dict[str, Any]] = Field(default=None, description="Harness options")
+    buff_options: Optional[BuffOptions] = Field(default=None, description="Buff options")
+    harness_options: Optional[HarnessOptions] = Field(default=None, description="Harness options")
     deprefix: Optional[str] = Field(default=None, description="Prefix to remove from model outputs")
     generate_autodan: Optional[str] = Field(default=None, description="AutoDAN config")
 
@@ -140,6 +174,9 @@ class BenchmarkRegistry:
     
     A benchmark is just a BenchmarkConfig. The only difference between 
     "predefined" and "custom" is who defines them (us vs. users).
+
+    Writes are serialized by a lock and publish a fresh read-only snapshot,
+    so lookups and listings never lock and never see a dict mid-resize.
     
     Example:
         >>> registry = BenchmarkRegistry()
@@ -160,9 +197,11 @@ class BenchmarkRegistry:
     """
     
     def __init__(self):
-        # All benchmarks stored uniformly as BenchmarkConfig
-        self._benchmarks: Dict[str, BenchmarkConfig] = dict(PREDEFINED_BENCHMARKS)
-        self._predefined_ids: set = set(PREDEFINED_BENCHMARKS.keys())
+        # All benchmarks stored uniformly as BenchmarkConfig; both snapshots
+        # are replaced wholesale under _lock and never mutated in place.
+        self._lock = threading.RLock()
+        self._benchmarks: Mapping[str, BenchmarkConfig] = MappingProxyType(dict(PREDEFINED_BENCHMARKS))
+        self._predefined_ids: frozenset = frozenset(PREDEFINED_BENCHMARKS.keys())
     
     def get(self, benchmark_id: str) -> Optional[BenchmarkConfig]:
         """Get a benchmark by ID."""
@@ -182,12 +221,15 @@ class BenchmarkRegistry:
             config: The benchmark configuration
             overwrite: Allow overwriting existing benchmarks
         """
-        if benchmark_id in self._benchmarks and not overwrite:
-            raise ValueError(
-                f"Benchmark '{benchmark_id}' already exists. "
-                f"Use overwrite=True to replace it."
-            )
-        self._benchmarks[benchmark_id] = config
+        with self._lock:
+            if benchmark_id in self._benchmarks and not overwrite:
+                raise ValueError(
+                    f"Benchmark '{benchmark_id}' already exists. "
+                    f"Use overwrite=True to replace it."
+                )
+            benchmarks = dict(self._benchmarks)
+            benchmarks[benchmark_id] = config
+            self._benchmarks = MappingProxyType(benchmarks)
     
     def unregister(self, benchmark_id: str) -> bool:
         """
@@ -195,11 +237,14 @@ class BenchmarkRegistry:
         
         Note: Predefined benchmarks can also be removed if desired.
         """
-        if benchmark_id in self._benchmarks:
-            del self._benchmarks[benchmark_id]
-            self._predefined_ids.discard(benchmark_id)
+        with self._lock:
+            if benchmark_id not in self._benchmarks:
+                return False
+            benchmarks = dict(self._benchmarks)
+            del benchmarks[benchmark_id]
+            self._benchmarks = MappingProxyType(benchmarks)
+            self._predefined_ids = self._predefined_ids - {benchmark_id}
             return True
-        return False
     
     def list(self) -> List[str]:
         """List all benchmark IDs."""
@@ -208,6 +253,7 @@ class BenchmarkRegistry:
     def list_with_info(self) -> Dict[str, Dict[str, Any]]:
         """List all benchmarks with summary info."""
         result = {}
+        predefined_ids = self._predefined_ids
         for benchmark_id, config in self._benchmarks.items():
             btype = "intents" if config.art_intents else (
                 "taxonomy" if config.taxonomy_filters else "probes"
@@ -216,7 +262,7 @@ class BenchmarkRegistry:
                 "name": config.name,
                 "description": config.description or "",
                 "type": btype,
-                "is_predefined": benchmark_id in self._predefined_ids,
+                "is_predefined": benchmark_id in predefined_ids,
             }
         return result
     
@@ -303,7 +349,7 @@ class KubeflowConfig(BaseSettings):
         description="Whether to verify SSL certificates. Can be a boolean or a path."
     )
 
-    model_config = ConfigDict(env_file=".env", env_prefix="KUBEFLOW_", extra="ignore")
+    model_config = ConfigDict(env_prefix="KUBEFLOW_", extra="ignore")
 
 
 class ModelConfig(BaseModel):
@@ -322,6 +368,10 @@ class ModelConfig(BaseModel):
         description="API key for the model serving endpoint"
     )
 
+    # Frozen (and therefore hashable) so copies of EvalConfig share the
+    # instance and it can be used as a cache key.
+    model_config = ConfigDict(frozen=True)
+
 class IntentsModelConfig(BaseModel):
     """Endpoint for one of the intents-pipeline auxiliary models."""
 
@@ -464,20 +514,25 @@ class EvalConfig(BaseModel):
         "translation models.  Required on disconnected clusters.",
     )
 
-    @model_validator(mode="after")
-    def validate_benchmark_source(self):
+    @field_validator("benchmark", mode="before")
+    @classmethod
+    def validate_benchmark_source(cls, v):
         """Ensure benchmark is specified either by ID or inline definition."""
-        if not isinstance(self.benchmark, (str, BenchmarkConfig)):
+        if not isinstance(v, (str, dict, BenchmarkConfig)):
             raise ValueError("Specify valid benchmark configuration.")
-        return self
+        return v
 
 
 __all__ = [
     "BenchmarkConfig",
     "BenchmarkRegistry",
+    "BuffOptions",
+    "DetectorOptions",
+    "HarnessOptions",
     "IntentsModelConfig",
     "PREDEFINED_BENCHMARKS",
     "EvalConfig",
     "KubeflowConfig",
     "ModelConfig",
+    "ProbeOptions",
 ]
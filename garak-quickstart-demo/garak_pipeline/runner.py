@@ -1,15 +1,22 @@
+import io
 import json
 import logging
 import os
+import tempfile
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import kfp
 import requests
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from llama_stack_provider_trustyai_garak.constants import DEFAULT_EVAL_THRESHOLD
 
@@ -20,10 +27,44 @@ from .config import (
     KubeflowConfig,
 )
 from .errors import GarakConfigError, GarakError, GarakValidationError
-from .utils import check_and_create_bucket, clean_ssl_verify, create_s3_client
+from .utils import check_and_create_bucket, clean_ssl_verify, create_s3_client, s3_transfer_config
+
+if TYPE_CHECKING:
+    import kfp
 
 logger = logging.getLogger(__name__)
 
+# KFP run states after which a run never changes again
+_TERMINAL_RUN_STATES = frozenset({"SUCCEEDED", "FAILED", "CANCELED"})
+# How long a non-terminal get_run response may be reused
+_RUN_CACHE_TTL_SECONDS = 5.0
+# Run ids per list_runs filter in job_status_many
+_LIST_RUNS_CHUNK = 50
+# How long wait_for_completion waits for a completed job's background result fetch
+_RESULT_FETCH_TIMEOUT_SECONDS = 300.0
+# Finished jobs kept in memory before the least recently used are dropped
+_MAX_RETAINED_JOBS = max(1, int(os.getenv("GARAK_MAX_RETAINED_JOBS", "1024")))
+# Kubeconfig tokens keyed by (kubeconfig path, context) -> (expiry, token)
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[float, str]] = {}
+_TOKEN_TTL_SECONDS = 300.0
+
+
+@lru_cache(maxsize=1)
+def _compiled_pipeline_package() -> str:
+    """Compile ``evalhub_garak_pipeline`` once per process and return the IR YAML path."""
+    from kfp import compiler
+    from llama_stack_provider_trustyai_garak.evalhub.kfp_pipeline import evalhub_garak_pipeline
+
+    fd, path = tempfile.mkstemp(prefix="evalhub_garak_pipeline-", suffix=".yaml")
+    os.close(fd)
+    compiler.Compiler().compile(evalhub_garak_pipeline, path)
+    logger.debug("Compiled evalhub_garak_pipeline to %s", path)
+    return path
+
+
+def _benchmark_id_for(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
 
 class ScanJob(BaseModel):
     """Represents a Garak security scan job"""
@@ -69,10 +110,33 @@ class PipelineRunner:
     def __init__(self, kfp_config: Optional[KubeflowConfig] = None):
         self.kfp_config = kfp_config or KubeflowConfig()
         self.scan_jobs: Dict[str, ScanJob] = {}
+        # guards scan_jobs and the per-job bookkeeping below, which run_scans updates from worker threads
+        self._jobs_lock = threading.RLock()
+        # finished job ids, least recently touched first
+        self._finished_jobs: "OrderedDict[str, None]" = OrderedDict()
+        self._run_cache: Dict[str, Tuple[float, Any]] = {}
+        self._run_locks: Dict[str, threading.Lock] = {}
+        self._job_events: Dict[str, threading.Event] = {}
+        # monotonic submit times; created_at stays as the display timestamp
+        self._job_start_monotonic: Dict[str, float] = {}
+        # background S3 result fetches, keyed by job_id
+        self._result_lock = threading.Lock()
+        self._result_executor: Optional[ThreadPoolExecutor] = None
+        self._result_futures: Dict[str, Future] = {}
         self._s3_bucket: str = ""
         self._s3_prefix: str = ""
         self._parse_s3_config()
-        self.s3_client = self._create_s3_client()
+        # Per-job artifacts live under "<prefix>/<job_id>/"; the layout is
+        # fixed for the runner's lifetime, so resolve the root once.
+        self._s3_key_root = f"{self._s3_prefix}/" if self._s3_prefix else ""
+        # S3 is only needed to read results; connect on first use
+        self._s3_lock = threading.Lock()
+        self._s3_client: Any = None
+        self._bucket_checked = False
+
+        # verify_ssl may be a bool, a bool-ish string or a CA bundle path;
+        # split it once for the KFP, HTTP and S3 clients.
+        self._verify_ssl, self._ssl_cert = self._resolve_verify(self.kfp_config.verify_ssl)
 
         self.benchmarks = BenchmarkRegistry()
         self.kfp_client = self._init_kfp_client()
@@ -113,6 +177,22 @@ class PipelineRunner:
 
         logger.info("Parsed S3 config — bucket: %s, prefix: %s", self._s3_bucket, self._s3_prefix)
 
+    @property
+    def s3_client(self) -> Any:
+        return self._ensure_s3()
+
+    def _ensure_s3(self) -> Any:
+        """Create the S3 client and verify the results bucket once, on first use."""
+        if self._s3_client is not None and self._bucket_checked:
+            return self._s3_client
+        with self._s3_lock:
+            if self._s3_client is None:
+                self._s3_client = self._create_s3_client()
+            if not self._bucket_checked:
+                check_and_create_bucket(self._s3_client, self._s3_bucket)
+                self._bucket_checked = True
+        return self._s3_client
+
     def _create_s3_client(self):
         """Create S3 client using credentials from the K8s Data Connection secret.
 
@@ -153,15 +233,13 @@ class PipelineRunner:
                 self.kfp_config.s3_credentials_secret_name,
             )
 
-        self.s3_client = create_s3_client(
+        return create_s3_client(
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
             region_name=region,
-            verify_ssl=self.kfp_config.verify_ssl,
+            verify_ssl=self._ssl_cert or self._verify_ssl,
         )
-        check_and_create_bucket(self.s3_client, self._s3_bucket)
-        return self.s3_client
 
     @staticmethod
     def _read_s3_credentials_from_secret(secret_name: str, namespace: str) -> dict:
@@ -217,35 +295,52 @@ class PipelineRunner:
     # KFP init
     # ------------------------------------------------------------------
 
-    def _init_kfp_client(self) -> kfp.Client:
+    @staticmethod
+    def _resolve_verify(verify_ssl: bool | str) -> Tuple[bool, Optional[str]]:
+        """Return ``(verify, ca_cert_path)`` for a ``verify_ssl`` setting."""
+        if isinstance(verify_ssl, str):
+            verify_ssl = clean_ssl_verify(verify_ssl)
+            if isinstance(verify_ssl, str):
+                return True, verify_ssl
+        return verify_ssl, None
+
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Retrying session for the one-off KFP healthz probe."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _init_kfp_client(self) -> "kfp.Client":
         """Initialize KFP client with OpenShift authentication."""
+        # kfp pulls in grpc/protobuf; only pay for it once a client is needed
+        import kfp
+
         try:
-            token = self.kfp_config.pipelines_api_token or self._get_token()
+            explicit_token = self.kfp_config.pipelines_api_token
+            token = explicit_token or self._get_token()
             if not token:
                 raise GarakError(
                     "No authentication token found. "
                     "Please check your KFP API token or run `oc login` and try again."
                 )
-            response = requests.get(
-                f"{self.kfp_config.pipelines_endpoint}/apis/v2beta1/healthz",
-                headers={"Accept": "application/json", "Authorization": f"Bearer {token}"},
-                timeout=5,
-            )
+            response = self._probe_healthz(token)
+            if response.status_code == 401 and not explicit_token:
+                # The cached kubeconfig token may have expired; resolve it afresh once.
+                self.invalidate_token_cache()
+                token = self._get_token()
+                response = self._probe_healthz(token)
             response.raise_for_status()
 
-            ssl_cert = None
-            verify_ssl = self.kfp_config.verify_ssl
-            if isinstance(self.kfp_config.verify_ssl, str):
-                verify_ssl = clean_ssl_verify(self.kfp_config.verify_ssl)
-                if isinstance(verify_ssl, str):
-                    ssl_cert = verify_ssl
-                    verify_ssl = True
-
             return kfp.Client(
                 host=self.kfp_config.pipelines_endpoint,
                 existing_token=token,
-                verify_ssl=verify_ssl,
-                ssl_ca_cert=ssl_cert,
+                verify_ssl=self._verify_ssl,
+                ssl_ca_cert=self._ssl_cert,
             )
         except requests.exceptions.RequestException as e:
             raise GarakError(
@@ -255,25 +350,114 @@ class PipelineRunner:
         except Exception as e:
             raise GarakError(f"Failed to initialize KFP client: {e}") from e
 
+    def _probe_healthz(self, token: str) -> requests.Response:
+        # Every later call goes through kfp.Client's own connection pool,
+        # so the probe gets a short-lived session rather than a pooled one.
+        with self._create_http_session() as session:
+            return session.get(
+                f"{self.kfp_config.pipelines_endpoint}/apis/v2beta1/healthz",
+                headers={"Accept": "application/json", "Authorization": f"Bearer {token}"},
+                verify=self._ssl_cert or self._verify_ssl,
+                timeout=(3, 5),
+            )
+
     def _get_token(self) -> str:
+        """Return the kubeconfig bearer token, cached per kubeconfig and context.
+
+        Resolving the token may run an exec plugin (e.g. ``oc``), so it is
+        reused for ``_TOKEN_TTL_SECONDS`` across runner instances.
+        """
         try:
             from kubernetes.client.configuration import Configuration
-            from kubernetes.client.exceptions import ApiException
-            from kubernetes.config.config_exception import ConfigException
-            from kubernetes.config.kube_config import load_kube_config
+            from kubernetes.config.kube_config import list_kube_config_contexts, load_kube_config
+
+            _, active_context = list_kube_config_contexts()
+            key = (os.getenv("KUBECONFIG", "~/.kube/config"), (active_context or {}).get("name", ""))
+            expiry, token = _TOKEN_CACHE.get(key, (0.0, ""))
+            if token and time.monotonic() < expiry:
+                return token
 
             config = Configuration()
             load_kube_config(client_configuration=config)
-            return config.api_key["authorization"].split(" ")[-1]
+            token = config.api_key["authorization"].split(" ")[-1]
+            _TOKEN_CACHE[key] = (time.monotonic() + _TOKEN_TTL_SECONDS, token)
+            return token
         except Exception as e:
             raise GarakError(f"Could not obtain Kubernetes token: {e}") from e
 
+    @staticmethod
+    def invalidate_token_cache() -> None:
+        """Drop cached kubeconfig tokens; done automatically when the KFP healthz probe gets a 401."""
+        _TOKEN_CACHE.clear()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def close(self) -> None:
+        """Release background worker threads."""
+        with self._result_lock:
+            executor, self._result_executor = self._result_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
     def run_scan(self, config: EvalConfig) -> ScanJob:
         """Run a Garak security scan (plain or intents)."""
+        job, benchmark_config = self._prepare_job(config)
+        started = time.monotonic()
+        kubeflow_run_id = self._submit_to_kubeflow(config, benchmark_config, job.benchmark_id, job)
+        self._record_submitted(job, kubeflow_run_id, started)
+        return job
+
+    def run_scans(self, configs: List[EvalConfig], max_parallel: int = 16) -> List[ScanJob]:
+        """Submit several scans concurrently.
+
+        Each config's benchmark is resolved and its KFP submission made on a
+        thread pool. Jobs are returned in the order of ``configs``; a config
+        that fails (unknown or conflicting benchmark, rejected submission) is
+        returned as a ``failed`` job with the error in ``metadata["error"]``
+        instead of aborting the batch.
+        """
+        if not configs:
+            return []
+        _compiled_pipeline_package()  # compile once before fanning out
+        # Resolve the experiment once: per-submission get-or-create by name races on a fresh namespace
+        experiment_id = self.kfp_client.create_experiment(
+            name=self.kfp_config.experiment_name,
+            namespace=self.kfp_config.namespace,
+        ).experiment_id
+
+        def _submit(config: EvalConfig) -> ScanJob:
+            job: Optional[ScanJob] = None
+            started = time.monotonic()
+            try:
+                job, benchmark_config = self._prepare_job(config)
+                run_id = self._submit_to_kubeflow(
+                    config, benchmark_config, job.benchmark_id, job, experiment_id=experiment_id
+                )
+            except Exception as e:
+                if job is None:
+                    benchmark_id = (
+                        config.benchmark
+                        if isinstance(config.benchmark, str)
+                        else _benchmark_id_for(config.benchmark.name)
+                    )
+                    job = self._new_job(config, benchmark_id)
+                logger.error("Failed to submit scan job %s: %s", job.job_id, e)
+                job.status = "failed"
+                job.metadata["error"] = str(e)
+                with self._jobs_lock:
+                    self.scan_jobs[job.job_id] = job
+                    self._retain_finished_job(job.job_id)
+                return job
+            self._record_submitted(job, run_id, started)
+            return job
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(configs)))) as pool:
+            return list(pool.map(_submit, configs))
+
+    def _prepare_job(self, config: EvalConfig) -> Tuple[ScanJob, BenchmarkConfig]:
+        """Resolve the benchmark for ``config`` and build its (not yet submitted) job."""
         if isinstance(config.benchmark, str):
             benchmark_id = config.benchmark
             benchmark_config = self.benchmarks.get(benchmark_id)
@@ -281,31 +465,34 @@ class PipelineRunner:
                 raise GarakConfigError(f"Benchmark '{benchmark_id}' not found")
         else:
             benchmark_config = config.benchmark
-            benchmark_id = benchmark_config.name.lower().replace(" ", "_")
+            benchmark_id = _benchmark_id_for(benchmark_config.name)
             self.register_benchmark(benchmark_id, benchmark_config)
+        return self._new_job(config, benchmark_id), benchmark_config
 
-        job_id = str(uuid.uuid4())
-        created_at = datetime.now().isoformat()
-        job = ScanJob(
-            job_id=job_id,
+    @staticmethod
+    def _new_job(config: EvalConfig, benchmark_id: str) -> ScanJob:
+        return ScanJob(
+            job_id=str(uuid.uuid4()),
             status="submitted",
             benchmark_id=benchmark_id,
             model_name=config.model.model_name,
-            created_at=created_at,
+            created_at=datetime.now().isoformat(),
         )
 
-        kubeflow_run_id = self._submit_to_kubeflow(config, benchmark_config, benchmark_id, job_id)
+    def _record_submitted(self, job: ScanJob, kubeflow_run_id: str, started: float) -> None:
         job.kubeflow_run_id = kubeflow_run_id
-        self.scan_jobs[job_id] = job
+        with self._jobs_lock:
+            self.scan_jobs[job.job_id] = job
+            self._job_events[job.job_id] = threading.Event()
+            self._job_start_monotonic[job.job_id] = started
 
         logger.info(
             "Submitted scan job %s for model '%s' with benchmark '%s' (run ID: %s)",
-            job_id,
-            config.model.model_name,
-            benchmark_id,
+            job.job_id,
+            job.model_name,
+            job.benchmark_id,
             kubeflow_run_id,
         )
-        return job
 
     def register_benchmark(self, benchmark_id: str, config: BenchmarkConfig, overwrite: bool = False) -> None:
         self.benchmarks.register(benchmark_id, config, overwrite=overwrite)
@@ -331,11 +518,11 @@ class PipelineRunner:
         eval_config: EvalConfig,
         benchmark_config: BenchmarkConfig,
         benchmark_id: str,
-    ) -> tuple[str, dict[str, Any]]:
+    ) -> tuple[str, dict[str, Any], int, float]:
         """Build the ``config_json`` and ``intents_params`` for the pipeline.
 
         Returns:
-            (config_json, intents_params)
+            (config_json, intents_params, timeout_seconds, eval_threshold)
         """
         from llama_stack_provider_trustyai_garak.core.command_builder import build_generator_options
         from llama_stack_provider_trustyai_garak.core.config_resolution import (
@@ -367,14 +554,20 @@ class PipelineRunner:
 
         # Resolve timeout and eval_threshold the same way the adapter does:
         # user override (EvalConfig) > profile > package default
-        self._resolved_timeout = resolve_timeout_seconds(
+        timeout = resolve_timeout_seconds(
             {"timeout": eval_config.timeout} if eval_config.timeout is not None else {},
             profile,
             default_timeout=DEFAULT_TIMEOUT,
         )
-        self._resolved_eval_threshold = float(
-            garak_config.to_dict().get("run", {}).get("eval_threshold", DEFAULT_EVAL_THRESHOLD)
-        )
+        if eval_config.eval_threshold is not None:
+            eval_threshold = float(eval_config.eval_threshold)
+            # keep config_json in step with the eval_threshold pipeline argument
+            garak_config.run.eval_threshold = eval_threshold
+        else:
+            profile_threshold = getattr(garak_config.run, "eval_threshold", None)
+            eval_threshold = float(
+                profile_threshold if profile_threshold is not None else DEFAULT_EVAL_THRESHOLD
+            )
 
         # Set generator from EvalConfig.model
         endpoint = eval_config.model.model_endpoint.rstrip("/")
@@ -419,8 +612,8 @@ class PipelineRunner:
         from llama_stack_provider_trustyai_garak.core.pipeline_steps import redact_api_keys
 
         config_dict = garak_config.to_dict(exclude_none=True)
-        config_json = json.dumps(redact_api_keys(config_dict))
-        return config_json, intents_params
+        config_json = json.dumps(redact_api_keys(config_dict), separators=(",", ":"))
+        return config_json, intents_params, timeout, eval_threshold
 
     # ------------------------------------------------------------------
     # Intents model overlay (extracted from garak_adapter logic)
@@ -520,12 +713,19 @@ class PipelineRunner:
         eval_config: EvalConfig,
         benchmark_config: BenchmarkConfig,
         benchmark_id: str,
-        job_id: str,
+        job: ScanJob,
+        experiment_id: Optional[str] = None,
     ) -> str:
-        """Submit the 6-step evalhub_garak_pipeline to KFP."""
-        from llama_stack_provider_trustyai_garak.evalhub.kfp_pipeline import evalhub_garak_pipeline
+        """Submit the 6-step evalhub_garak_pipeline to KFP.
 
-        config_json, intents_params = self._build_config(eval_config, benchmark_config, benchmark_id)
+        Safe to call from several threads at once: everything resolved for
+        this submission stays local or lands on ``job``. Concurrent callers
+        should pass an ``experiment_id`` resolved up front, since resolving
+        ``experiment_name`` is a get-or-create that races on a fresh namespace.
+        """
+        config_json, intents_params, timeout, eval_threshold = self._build_config(
+            eval_config, benchmark_config, benchmark_id
+        )
 
         # Validate intents SDG requirements (same checks as the eval-hub adapter)
         if intents_params.get("art_intents"):
@@ -549,10 +749,11 @@ class PipelineRunner:
                         "Set intents_models.sdg.url in your EvalConfig."
                     )
 
-        eval_threshold = self._resolved_eval_threshold
-        timeout = self._resolved_timeout
+        job_id = job.job_id
+        # _fetch_results scores with the same threshold the run used
+        job.metadata["eval_threshold"] = eval_threshold
 
-        s3_prefix = f"{self._s3_prefix}/{job_id}" if self._s3_prefix else job_id
+        s3_prefix = self._s3_key_root + job_id
         run_name = f"garak-{benchmark_id}-{job_id[:8]}"
 
         arguments: dict[str, Any] = {
@@ -577,12 +778,16 @@ class PipelineRunner:
             "sdg_max_tokens": intents_params.get("sdg_max_tokens", eval_config.sdg_max_tokens),
         }
 
-        run_result = self.kfp_client.create_run_from_pipeline_func(
-            pipeline_func=evalhub_garak_pipeline,
+        run_result = self.kfp_client.create_run_from_pipeline_package(
+            pipeline_file=_compiled_pipeline_package(),
             arguments=arguments,
             run_name=run_name,
             namespace=self.kfp_config.namespace,
-            experiment_name=self.kfp_config.experiment_name,
+            **(
+                {"experiment_id": experiment_id}
+                if experiment_id
+                else {"experiment_name": self.kfp_config.experiment_name}
+            ),
         )
         return run_result.run_id
 
@@ -590,26 +795,136 @@ class PipelineRunner:
     # Job lifecycle
     # ------------------------------------------------------------------
 
+    def _get_run(self, run_id: str) -> Any:
+        """Fetch KFP run detail, reusing a recent response for non-terminal runs.
+
+        Concurrent callers for the same run wait on a per-run lock and share
+        a single ``get_run`` request instead of each issuing their own.
+        """
+        lock = self._run_locks.setdefault(run_id, threading.Lock())
+        with lock:
+            ts, cached = self._run_cache.get(run_id, (0.0, None))
+            if cached is not None and time.monotonic() - ts < _RUN_CACHE_TTL_SECONDS:
+                return cached
+            run_detail = self.kfp_client.get_run(run_id)
+            if run_detail.state in _TERMINAL_RUN_STATES:
+                self._run_cache.pop(run_id, None)
+            else:
+                self._run_cache[run_id] = (time.monotonic(), run_detail)
+            return run_detail
+
+    def _apply_run_state(self, job: ScanJob, run_detail: Any) -> None:
+        """Map a KFP run state onto the job status."""
+        if run_detail.state == "FAILED":
+            job.status = "failed"
+        elif run_detail.state == "SUCCEEDED":
+            job.status = "completed"
+            self._schedule_fetch_results(job)
+        elif run_detail.state in ("RUNNING", "PENDING"):
+            job.status = "in_progress"
+        elif run_detail.state == "CANCELED":
+            job.status = "cancelled"
+        else:
+            job.status = "unknown"
+        if run_detail.state in _TERMINAL_RUN_STATES:
+            self._retain_finished_job(job.job_id)
+
+    def _retain_finished_job(self, job_id: str) -> None:
+        """Mark a finished job as recently used and evict the oldest past the cap."""
+        with self._jobs_lock:
+            self._finished_jobs[job_id] = None
+            self._finished_jobs.move_to_end(job_id)
+            while len(self.scan_jobs) > _MAX_RETAINED_JOBS and len(self._finished_jobs) > 1:
+                oldest_id, _ = self._finished_jobs.popitem(last=False)
+                if (oldest := self.scan_jobs.pop(oldest_id, None)) is not None:
+                    self._run_cache.pop(oldest.kubeflow_run_id, None)
+                    self._run_locks.pop(oldest.kubeflow_run_id, None)
+                self._job_events.pop(oldest_id, None)
+                self._job_start_monotonic.pop(oldest_id, None)
+                logger.debug("Evicted finished job %s from memory", oldest_id)
+
     def job_status(self, job_id: str) -> ScanJob:
         if (job := self.scan_jobs.get(job_id)) is None:
             raise RuntimeError(f"Job {job_id} not found")
         try:
-            run_detail = self.kfp_client.get_run(job.kubeflow_run_id)
-            if run_detail.state == "FAILED":
-                job.status = "failed"
-            elif run_detail.state == "SUCCEEDED":
-                job.status = "completed"
-                self._fetch_results(job)
-            elif run_detail.state in ("RUNNING", "PENDING"):
-                job.status = "in_progress"
-            elif run_detail.state == "CANCELED":
-                job.status = "cancelled"
-            else:
-                job.status = "unknown"
+            self._apply_run_state(job, self._get_run(job.kubeflow_run_id))
         except Exception as e:
             logger.error("Failed to get job status: %s", e)
         return job
 
+    def job_status_many(self, job_ids: List[str]) -> Dict[str, ScanJob]:
+        """Refresh the status of several jobs with ``list_runs``.
+
+        Run ids are filtered in chunks of ``_LIST_RUNS_CHUNK`` and each chunk is
+        paged until ``next_page_token`` is empty, since the API server caps
+        ``page_size``; a handful of requests cover any number of jobs.
+        """
+        jobs: Dict[str, ScanJob] = {}
+        for job_id in job_ids:
+            if (job := self.scan_jobs.get(job_id)) is None:
+                raise RuntimeError(f"Job {job_id} not found")
+            jobs[job_id] = job
+
+        by_run_id = {job.kubeflow_run_id: job for job in jobs.values() if job.kubeflow_run_id}
+        if not by_run_id:
+            return jobs
+
+        run_ids = list(by_run_id)
+        for start in range(0, len(run_ids), _LIST_RUNS_CHUNK):
+            chunk = run_ids[start : start + _LIST_RUNS_CHUNK]
+            run_filter = json.dumps({
+                "predicates": [{
+                    "key": "run_id",
+                    "operation": "IN",
+                    "string_values": {"values": chunk},
+                }]
+            })
+            page_token = ""
+            try:
+                while True:
+                    response = self.kfp_client.list_runs(
+                        page_token=page_token,
+                        page_size=len(chunk),
+                        filter=run_filter,
+                        namespace=self.kfp_config.namespace,
+                    )
+                    for run_detail in response.runs or []:
+                        if (job := by_run_id.get(run_detail.run_id)) is None:
+                            continue
+                        if run_detail.state not in _TERMINAL_RUN_STATES:
+                            self._run_cache[run_detail.run_id] = (time.monotonic(), run_detail)
+                        self._apply_run_state(job, run_detail)
+                    if not (page_token := response.next_page_token):
+                        break
+            except Exception as e:
+                logger.error("Failed to get job statuses: %s", e)
+        return jobs
+
+    def _schedule_fetch_results(self, job: ScanJob) -> None:
+        """Fetch results in the background so status polls don't block on S3."""
+        if job.result:
+            return
+        with self._result_lock:
+            if job.job_id in self._result_futures:
+                return
+            if self._result_executor is None:
+                self._result_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="garak-results"
+                )
+            future = self._result_executor.submit(self._fetch_results, job)
+            self._result_futures[job.job_id] = future
+
+        def _done(done: Future) -> None:
+            with self._result_lock:
+                self._result_futures.pop(job.job_id, None)
+            if not done.cancelled() and (exc := done.exception()) is not None:
+                logger.error(
+                    "Failed to fetch results for job %s", job.job_id, exc_info=exc
+                )
+            self._notify(job.job_id)
+
+        future.add_done_callback(_done)
+
     def _fetch_results(self, job: ScanJob):
         """Fetch and parse results from S3."""
         if job.result:
@@ -622,15 +937,19 @@ class PipelineRunner:
             parse_generations_from_report_content,
         )
 
-        s3_prefix = f"{self._s3_prefix}/{job.job_id}" if self._s3_prefix else job.job_id
+        self._ensure_s3()
+        s3_prefix = self._s3_key_root + job.job_id
         logger.debug(
             "Fetching results — bucket=%s, prefix=%s", self._s3_bucket, s3_prefix
         )
 
         def _download_text(key: str) -> str:
             try:
-                resp = self.s3_client.get_object(Bucket=self._s3_bucket, Key=key)
-                return resp["Body"].read().decode("utf-8")
+                buf = io.BytesIO()
+                self.s3_client.download_fileobj(
+                    self._s3_bucket, key, buf, Config=s3_transfer_config()
+                )
+                return buf.getvalue().decode("utf-8")
             except Exception:
                 logger.warning(
                     "Failed to download s3://%s/%s", self._s3_bucket, key, exc_info=True
@@ -650,7 +969,7 @@ class PipelineRunner:
 
         benchmark_cfg = self.benchmarks.get(job.benchmark_id)
         art_intents = benchmark_cfg.art_intents if benchmark_cfg else False
-        eval_threshold = getattr(self, "_resolved_eval_threshold", DEFAULT_EVAL_THRESHOLD)
+        eval_threshold = job.metadata.get("eval_threshold", DEFAULT_EVAL_THRESHOLD)
 
         generations, score_rows_by_probe, raw_entries_by_probe = (
             parse_generations_from_report_content(report_content, eval_threshold)
@@ -670,12 +989,81 @@ class PipelineRunner:
         job.result = combined
         logger.info("Parsed results for job %s", job.job_id)
 
+    def _fetch_results_once(self, job: ScanJob) -> None:
+        """Fetch results in the calling thread, or join a fetch already in flight.
+
+        The fetch is registered in ``_result_futures`` while it runs, so a
+        background fetch scheduled meanwhile joins it rather than racing it.
+        """
+        with self._result_lock:
+            future = self._result_futures.get(job.job_id)
+            owner = future is None
+            if owner:
+                future = self._result_futures[job.job_id] = Future()
+        if not owner:
+            future.result()
+            return
+        try:
+            self._fetch_results(job)
+            future.set_result(None)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._result_lock:
+                if self._result_futures.get(job.job_id) is future:
+                    del self._result_futures[job.job_id]
+
+    def fetch_results_many(
+        self, job_ids: List[str], max_workers: int = 8, check_s3: bool = False
+    ) -> Dict[str, Optional[Dict]]:
+        """Fetch results for several jobs concurrently.
+
+        By default only jobs whose status is ``completed`` are fetched.  With
+        ``check_s3``, each job's own prefix is instead checked for
+        ``scan.report.jsonl`` with a one-key ``list_objects_v2``, so jobs whose
+        status has not been refreshed yet are fetched once their report is
+        uploaded.  Jobs without results map to ``None``.  The boto3 client is
+        thread-safe, so all workers share its connection pool.
+        """
+        jobs: List[ScanJob] = []
+        for job_id in job_ids:
+            if (job := self.scan_jobs.get(job_id)) is None:
+                raise RuntimeError(f"Job {job_id} not found")
+            jobs.append(job)
+
+        if check_s3:
+            to_fetch = [job for job in jobs if not job.result]
+        else:
+            to_fetch = [job for job in jobs if job.status == "completed" and not job.result]
+        if to_fetch:
+            s3 = self._ensure_s3()
+
+            def _fetch(job: ScanJob) -> None:
+                if check_s3:
+                    with self._result_lock:
+                        in_flight = job.job_id in self._result_futures
+                    if not in_flight and not s3.list_objects_v2(
+                        Bucket=self._s3_bucket,
+                        Prefix=f"{self._s3_key_root}{job.job_id}/scan.report.jsonl",
+                        MaxKeys=1,
+                    ).get("KeyCount", 0):
+                        return  # report not uploaded yet
+                self._fetch_results_once(job)
+
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_fetch)))) as executor:
+                list(executor.map(_fetch, to_fetch))
+        return {
+            job.job_id: (job.result or None) if check_s3 or job.status == "completed" else None
+            for job in jobs
+        }
+
     def job_result(self, job_id: str) -> Optional[Dict]:
         if (job := self.scan_jobs.get(job_id)) is None:
             raise RuntimeError(f"Job {job_id} not found")
         if job.status == "completed":
             if not job.result:
-                self._fetch_results(job)
+                self._fetch_results_once(job)
             return job.result
         elif job.status == "failed":
             raise RuntimeError(f"Job {job_id} failed")
@@ -697,7 +1085,8 @@ class PipelineRunner:
         if (job := self.scan_jobs.get(job_id)) is None:
             raise RuntimeError(f"Job {job_id} not found")
 
-        s3_prefix = f"{self._s3_prefix}/{job_id}" if self._s3_prefix else job_id
+        self._ensure_s3()
+        s3_prefix = self._s3_key_root + job_id
 
         benchmark_cfg = self.benchmarks.get(job.benchmark_id)
         art_intents = benchmark_cfg.art_intents if benchmark_cfg else False
@@ -711,13 +1100,18 @@ class PipelineRunner:
         out.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            response = self.s3_client.get_object(Bucket=self._s3_bucket, Key=html_key)
-            out.write_bytes(response["Body"].read())
+            # Stream straight to disk; large reports never sit in memory.
+            with out.open("wb") as f:
+                self.s3_client.download_fileobj(
+                    self._s3_bucket, html_key, f, Config=s3_transfer_config()
+                )
             logger.info("HTML report saved to: %s", out.absolute())
             return str(out.absolute())
         except ClientError as e:
+            out.unlink(missing_ok=True)
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            if error_code != "NoSuchKey":
+            # download_fileobj HEADs the object first, so a missing key shows up as 404
+            if error_code not in ("NoSuchKey", "404"):
                 raise RuntimeError(f"Failed to download HTML report: {e}") from e
 
             if not art_intents:
@@ -731,8 +1125,11 @@ class PipelineRunner:
             )
             report_key = f"{s3_prefix}/scan.report.jsonl"
             try:
-                resp = self.s3_client.get_object(Bucket=self._s3_bucket, Key=report_key)
-                report_content = resp["Body"].read().decode("utf-8")
+                buf = io.BytesIO()
+                self.s3_client.download_fileobj(
+                    self._s3_bucket, report_key, buf, Config=s3_transfer_config()
+                )
+                report_content = buf.getvalue().decode("utf-8")
             except Exception as dl_err:
                 raise RuntimeError(
                     f"Could not download report.jsonl for local HTML generation: {dl_err}"
@@ -752,11 +1149,29 @@ class PipelineRunner:
             raise RuntimeError(f"Job {job_id} not found")
         try:
             self.kfp_client.terminate_run(job.kubeflow_run_id)
+            self._run_cache.pop(job.kubeflow_run_id, None)
             job.status = "cancelled"
+            self._notify(job_id)
+            self._retain_finished_job(job_id)
             logger.info("Cancelled KFP run %s for job %s", job.kubeflow_run_id, job_id)
         except Exception as e:
             raise RuntimeError(f"Failed to cancel job: {e}") from e
 
+    def _await_result_fetch(self, job_id: str) -> None:
+        """Wait for a job's in-flight background result fetch, if any."""
+        with self._result_lock:
+            future = self._result_futures.get(job_id)
+        if future is not None:
+            try:
+                future.result(timeout=_RESULT_FETCH_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning("Results for job %s are not available: %s", job_id, e)
+
+    def _notify(self, job_id: str) -> None:
+        """Wake any ``wait_for_completion`` call blocked on this job."""
+        if (event := self._job_events.get(job_id)) is not None:
+            event.set()
+
     def wait_for_completion(
         self,
         job_id: str,
@@ -768,12 +1183,24 @@ class PipelineRunner:
             print(f"Waiting for job {job_id} to complete...")
             print(f"Monitor at: {self.kfp_config.pipelines_endpoint}/#/runs/details/{status.kubeflow_run_id}")
 
+        event = self._job_events.setdefault(job_id, threading.Event())
+        started = self._job_start_monotonic.setdefault(job_id, time.monotonic())
+        # Poll quickly at first and back off towards poll_interval, so short
+        # jobs are noticed promptly without hammering the API on long ones.
+        delay = 1.0
         while status.status in ("submitted", "in_progress"):
             if verbose:
-                elapsed = (datetime.now() - datetime.fromisoformat(status.created_at)).total_seconds()
-                print(f"  Status: {status.status} (elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s)")
-            time.sleep(poll_interval)
+                minutes, seconds = divmod(int(time.monotonic() - started), 60)
+                print(f"  Status: {status.status} (elapsed: {minutes}m {seconds}s)")
+            # Wake early if the job is updated from another thread (e.g. cancelled).
+            event.wait(timeout=min(delay, poll_interval))
+            event.clear()
+            previous = status.status
             status = self.job_status(job_id=job_id)
+            delay = 1.0 if status.status != previous else min(poll_interval, delay * 1.5)
+
+        if status.status == "completed":
+            self._await_result_fetch(job_id)
 
         if verbose:
             if status.status == "completed":
@@ -784,3 +1211,33 @@ class PipelineRunner:
                 print("Job cancelled!")
 
         return status
+
+    def wait_for_many(
+        self,
+        job_ids: List[str],
+        poll_interval: int = 30,
+        verbose: bool = True,
+    ) -> Dict[str, ScanJob]:
+        """Wait for several jobs, refreshing all pending ones per poll with one ``list_runs`` call."""
+        statuses = self.job_status_many(job_ids)
+        pending = [jid for jid, job in statuses.items() if job.status in ("submitted", "in_progress")]
+        if verbose:
+            print(f"Waiting for {len(pending)} of {len(statuses)} jobs to complete...")
+
+        while pending:
+            time.sleep(poll_interval)
+            statuses.update(self.job_status_many(pending))
+            still_pending = []
+            for jid in pending:
+                if statuses[jid].status in ("submitted", "in_progress"):
+                    still_pending.append(jid)
+                elif verbose:
+                    print(f"  Job {jid}: {statuses[jid].status}")
+            pending = still_pending
+            if verbose and pending:
+                print(f"  {len(pending)} job(s) still running")
+
+        for jid, job in statuses.items():
+            if job.status == "completed":
+                self._await_result_fetch(jid)
+        return statuses
@@ -1,5 +1,11 @@
+import hashlib
 import logging
-import boto3
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
 
 logger = logging.getLogger(__name__)
 
@@ -19,32 +25,71 @@ def load_kube_config():
 
     return config
 
+@lru_cache(maxsize=8)
 def clean_ssl_verify(verify_ssl: str) -> bool | str:
-    if verify_ssl.lower().strip() in ("true", "1", "yes", "on", ""):
+    normalized = verify_ssl.lower().strip()
+    if normalized in ("true", "1", "yes", "on", ""):
         return True
-    elif verify_ssl.lower().strip() in ("false", "0", "no", "off"):
+    elif normalized in ("false", "0", "no", "off"):
         return False
     else:
         return verify_ssl
 
-def create_s3_client(endpoint_url: str, aws_access_key_id: str, aws_secret_access_key: str, region_name: str, verify_ssl: bool | str) -> boto3.client:
-    from botocore.config import Config
-    
-    boto_config = Config(
-        retries={'max_attempts': 3, 'mode': 'standard'}
+# Shared S3 clients, one per endpoint/credentials/settings. boto3 clients are
+# thread-safe, so every runner in the process can share one connection pool.
+_S3_CLIENTS: Dict[tuple, "BaseClient"] = {}
+_S3_CLIENTS_LOCK = threading.Lock()
+
+def create_s3_client(endpoint_url: str, aws_access_key_id: str, aws_secret_access_key: str, region_name: str, verify_ssl: bool | str, max_pool_connections: int = 32) -> "BaseClient":
+    verify = clean_ssl_verify(verify_ssl) if isinstance(verify_ssl, str) else verify_ssl
+    # Credentials only enter the key as digests
+    key = (
+        endpoint_url,
+        region_name,
+        hashlib.sha1((aws_access_key_id or "").encode()).hexdigest(),
+        hashlib.sha1((aws_secret_access_key or "").encode()).hexdigest(),
+        verify,
+        max_pool_connections,
+    )
+    with _S3_CLIENTS_LOCK:
+        if (client := _S3_CLIENTS.get(key)) is not None:
+            return client
+
+        import boto3
+        from botocore.config import Config
+
+        boto_config = Config(
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            max_pool_connections=max_pool_connections,
+            # keep idle pooled connections from being silently dropped by load balancers
+            tcp_keepalive=True,
+        )
+
+        client = boto3.client(
+                    's3',
+                    endpoint_url=endpoint_url,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    region_name=region_name,
+                    verify=verify,
+                    config=boto_config
+                )
+        _S3_CLIENTS[key] = client
+        return client
+
+@lru_cache(maxsize=1)
+def s3_transfer_config():
+    """Transfer settings for downloads: ranged GETs in parallel above 8 MiB."""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=8,
+        use_threads=True,
     )
 
-    return boto3.client(
-                's3',
-                endpoint_url=endpoint_url,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=region_name,
-                verify=clean_ssl_verify(verify_ssl) if isinstance(verify_ssl, str) else verify_ssl,
-                config=boto_config
-            )
-
-def check_and_create_bucket(s3_client: boto3.client, bucket: str):
+def check_and_create_bucket(s3_client: "BaseClient", bucket: str):
     from botocore.exceptions import ClientError
 
     try:
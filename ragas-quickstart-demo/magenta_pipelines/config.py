@@ -1,11 +1,16 @@
 import json
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings
-from ragas.metrics import Metric
 
-from .constants import METRIC_MAPPING
+if TYPE_CHECKING:
+    from ragas.metrics import Metric
+
+# Load .env into os.environ once instead of per settings instantiation.
+load_dotenv(".env", override=False)
 
 
 class RagasConfig(BaseModel):
@@ -16,6 +21,12 @@ class RagasConfig(BaseModel):
         description="Batch size for evaluation. If None, no batching is done.",
     )
 
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Concurrent metric evaluations. If None, they run one at a time.",
+    )
+
     show_progress: bool = Field(
         default=True, description="Whether to show progress bar during evaluation"
     )
@@ -45,7 +56,7 @@ class KubeflowConfig(BaseSettings):
         description="Base image for Kubeflow pipeline components",
     )
 
-    model_config = ConfigDict(env_file=".env", env_prefix="KUBEFLOW_", extra="ignore")
+    model_config = ConfigDict(env_prefix="KUBEFLOW_", extra="ignore")
 
 
 class EvalConfig(BaseSettings):
@@ -108,9 +119,11 @@ class EvalConfig(BaseSettings):
             return json.loads(v)
         return v
 
-    @property
-    @computed_field(return_type=List[Metric])
-    def metric_functions(self) -> List[Metric]:
+    @cached_property
+    def metric_functions(self) -> List["Metric"]:
+        """Ragas metric objects for ``metric_names``, resolved on first access."""
+        from .constants import METRIC_MAPPING
+
         return [METRIC_MAPPING[metric] for metric in self.metric_names]
 
     ragas_config: RagasConfig = Field(
@@ -118,4 +131,4 @@ class EvalConfig(BaseSettings):
         description="Additional configuration parameters for Ragas",
     )
 
-    model_config = ConfigDict(env_file=".env", extra="ignore")
+    model_config = ConfigDict(extra="ignore")
@@ -1,22 +1,38 @@
-from ragas.metrics import (
-    answer_relevancy,
-    context_precision,
-    context_recall,
-    faithfulness,
-)
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict
 
-METRIC_MAPPING = {
-    metric_func.name: metric_func
-    for metric_func in [
+if TYPE_CHECKING:
+    from ragas.metrics import Metric
+
+
+@lru_cache(maxsize=1)
+def _metric_mapping() -> Dict[str, "Metric"]:
+    from ragas.metrics import (
         answer_relevancy,
         context_precision,
-        faithfulness,
         context_recall,
-        # TODO: add these later
-        # "answer_correctness": AnswerCorrectness(),
-        # "factual_correctness": FactualCorrectness(),
-        # "summarization_score": SummarizationScore(),
-        # "bleu_score": BleuScore(),
-        # "rouge_score": RougeScore(),
-    ]
-}
+        faithfulness,
+    )
+
+    return {
+        metric_func.name: metric_func
+        for metric_func in [
+            answer_relevancy,
+            context_precision,
+            faithfulness,
+            context_recall,
+            # TODO: add these later
+            # "answer_correctness": AnswerCorrectness(),
+            # "factual_correctness": FactualCorrectness(),
+            # "summarization_score": SummarizationScore(),
+            # "bleu_score": BleuScore(),
+            # "rouge_score": RougeScore(),
+        ]
+    }
+
+
+def __getattr__(name: str):
+    # ragas.metrics takes a while to import; only pay for it once METRIC_MAPPING is used.
+    if name == "METRIC_MAPPING":
+        return _metric_mapping()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
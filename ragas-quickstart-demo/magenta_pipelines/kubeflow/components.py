@@ -14,13 +14,18 @@ def retrieve_data_from_llama_stack(
     output_dataset: dsl.Output[dsl.Dataset],
     num_examples: int = -1,  # TODO: parse this
 ):
-    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
     from llama_stack_client import LlamaStackClient
 
     client = LlamaStackClient(base_url=llama_stack_base_url)
     dataset = client.datasets.retrieve(dataset_id=dataset_id)
-    df = pd.DataFrame(dataset.source.rows)
-    df.to_json(output_dataset.path, orient="records", lines=True)
+    # hand the rows to the next component as Parquet, without a DataFrame/JSON round-trip
+    pq.write_table(
+        pa.Table.from_pylist(dataset.source.rows),
+        output_dataset.path,
+        compression="zstd",
+    )
 
 
 @dsl.component(base_image=os.environ["KUBEFLOW_BASE_IMAGE"])
@@ -33,6 +38,8 @@ def run_ragas_evaluation(
     input_dataset: Optional[dsl.Input[dsl.Dataset]] = None,
     input_dataset_uri: Optional[str] = None,
     output_dataset_uri: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
 ):
     import logging
 
@@ -64,11 +71,10 @@ def run_ragas_evaluation(
     )
 
     metrics = [METRIC_MAPPING[m] for m in metrics]
-    run_config = RunConfig(max_workers=1)
 
     if input_dataset is not None:
-        with open(input_dataset.path) as f:
-            df_input = pd.read_json(f, lines=True)
+        # written as Parquet by retrieve_data_from_llama_stack
+        df_input = pd.read_parquet(input_dataset.path)
     elif input_dataset_uri is not None:
         df_input = pd.read_json(input_dataset_uri, lines=True)
     else:
@@ -76,12 +82,17 @@ def run_ragas_evaluation(
 
     eval_dataset = EvaluationDataset.from_list(df_input.to_dict(orient="records"))
 
+    # the default endpoint (Ollama) serves few requests in parallel and queued calls that
+    # hit RunConfig's timeout come back as NaN scores, so stay serial unless asked for more
+    run_config = RunConfig(max_workers=max_workers or 1)
+
     ragas_output: EvaluationResult = evaluate(
         dataset=eval_dataset,
         metrics=metrics,
         llm=llm,
         embeddings=embeddings,
         run_config=run_config,
+        batch_size=batch_size,
     )
 
     df_output = ragas_output.to_pandas()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from kfp import dsl, kubernetes
 
@@ -16,6 +16,8 @@ def ragas_evaluation_pipeline(
     embedding_model: str,
     metrics: List[str],
     inference_url: str,
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
 ):
     # TODO: consider a step here to validate that:
     # dataset exists, has data,
@@ -29,8 +31,17 @@ def ragas_evaluation_pipeline(
         inference_url=inference_url,
         input_dataset_uri=input_dataset_uri,
         output_dataset_uri=output_dataset_uri,
+        max_workers=max_workers,
+        batch_size=batch_size,
     )
 
+    # evaluation is I/O bound on the inference endpoint; keep the pod small so it packs well
+    ragas_task.set_cpu_request("500m").set_cpu_limit("2")
+    ragas_task.set_memory_request("1Gi").set_memory_limit("4Gi")
+
+    # reuse the component image when it is already on the node instead of re-pulling it
+    kubernetes.set_image_pull_policy(ragas_task, "IfNotPresent")
+
     # the ragas_task needs to retrieve and store the results to S3
     kubernetes.use_secret_as_env(
         ragas_task,
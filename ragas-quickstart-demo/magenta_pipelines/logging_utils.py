@@ -1,17 +1,16 @@
-import contextlib
 from io import StringIO
 
 from rich.console import Console
-from rich.errors import NotRenderableError
 from rich.table import Table
 
 
-def render_dataframe_as_table(df, title="Evaluation Results") -> str:
+def render_dataframe_as_table(df, title="Evaluation Results", max_rows=50) -> str:
     """Render dataframe as a rich table for logging.
 
     Args:
         df: pandas DataFrame to render
         title: Title for the table
+        max_rows: Only the first ``max_rows`` rows are rendered
 
     Returns:
         String representation of the rich table
@@ -19,16 +18,18 @@ def render_dataframe_as_table(df, title="Evaluation Results") -> str:
     string_buffer = StringIO()
     console = Console(file=string_buffer, width=120)
 
-    df_str = df.astype(str)
+    # only stringify what will actually be shown
+    df_str = df.head(max_rows).astype(str)
 
-    table = Table(title=title)
+    caption = f"showing {len(df_str)} of {len(df)} rows" if len(df) > len(df_str) else None
+    table = Table(title=title, caption=caption)
 
     for col in df_str.columns:
-        table.add_column(col, justify="left")
+        table.add_column(str(col), justify="left")
 
-    for row in df_str.values:
-        with contextlib.suppress(NotRenderableError):
-            table.add_row(*row)
+    # every cell is a str after astype(str), so each row is renderable
+    for row in df_str.itertuples(index=False, name=None):
+        table.add_row(*row)
 
     console.print(table)
     return string_buffer.getvalue()
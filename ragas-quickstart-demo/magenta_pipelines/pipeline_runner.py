@@ -1,79 +1,264 @@
+import hashlib
+import json
 import logging
+import os
+import random
 import subprocess
+import tempfile
+import time
 import uuid
-from typing import Dict
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 import kfp
+import numpy as np
 import pandas as pd
 import requests
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import EvalConfig, KubeflowConfig
 from .logging_utils import render_dataframe_as_table
 
 logger = logging.getLogger(__name__)
 
+# Local Parquet copies of fetched results, named by the S3 object's ETag;
+# the least recently used are deleted past _RESULTS_CACHE_MAX_FILES
+_RESULTS_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "ragas" / "results"
+)
+_RESULTS_CACHE_MAX_FILES = 64
+
+# Cached API token as (expiry, token). The TTL is well inside both an OpenShift
+# login's lifetime and the kubelet's hourly service account token rotation.
+_token: Tuple[float, str] | None = None
+_TOKEN_TTL_SECONDS = 600.0
+_SERVICE_ACCOUNT_TOKEN = Path("/var/run/secrets/kubernetes.io/serviceaccount/token")
+
+# How long a fetched run state answers job_status before KFP is asked again
+_RUN_STATE_TTL_SECONDS = 2.0
+
+# Run ids per list_runs filter when refreshing many jobs at once
+_LIST_RUNS_CHUNK = 50
+
+# Length of each workflow watch in wait_for_completion; KFP is checked between windows
+_WATCH_WINDOW_SECONDS = 45
+
+
+def _get_token() -> str:
+    """The `oc login` token, falling back to the pod's service account token.
+
+    A user's own login wins even inside a workbench pod, where the service
+    account token file always exists but often lacks access to pipelines.
+    """
+    global _token
+    if _token is not None and _token[0] > time.monotonic():
+        return _token[1]
+
+    try:
+        result = subprocess.run(
+            ["oc", "whoami", "-t"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        )
+        token = result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        if not _SERVICE_ACCOUNT_TOKEN.exists():
+            raise
+        token = _SERVICE_ACCOUNT_TOKEN.read_text().strip()
+    if not token:
+        raise RuntimeError("No token found. Please run `oc login` and try again.")
+    _token = (time.monotonic() + _TOKEN_TTL_SECONDS, token)
+    return token
+
+
+def _restore_list_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Turn the numpy arrays Arrow/Parquet give list columns (e.g. ``retrieved_contexts``) back into lists."""
+    for name in df.columns[df.dtypes == object]:
+        if df[name].map(lambda v: isinstance(v, np.ndarray)).any():
+            df[name] = df[name].map(lambda v: v.tolist() if isinstance(v, np.ndarray) else v)
+    return df
+
+
+def _prune_results_cache() -> None:
+    """Delete the least recently used result copies past ``_RESULTS_CACHE_MAX_FILES``."""
+    try:
+        files = sorted(
+            _RESULTS_CACHE_DIR.glob("*.parquet"), key=lambda f: f.stat().st_mtime, reverse=True
+        )
+        for stale in files[_RESULTS_CACHE_MAX_FILES:]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not prune {_RESULTS_CACHE_DIR}: {e}")
+
+
+def _create_http_session() -> requests.Session:
+    """Retrying session for the one-off KFP healthz probe."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _custom_objects_api():
+    """Kubernetes CustomObjectsApi for watching workflows, configured once per process.
+
+    Uses the kubeconfig (the user's login) when there is one and the pod's
+    in-cluster config otherwise, on a private client configuration so the
+    kubernetes package's global default is left alone.
+    """
+    from kubernetes import client, config
+
+    configuration = client.Configuration()
+    try:
+        config.load_kube_config(client_configuration=configuration)
+    except config.ConfigException:
+        config.load_incluster_config(client_configuration=configuration)
+    return client.CustomObjectsApi(client.ApiClient(configuration))
+
+
+@lru_cache(maxsize=1)
+def _compiled_pipeline_package() -> str:
+    """Compile ``ragas_evaluation_pipeline`` once per process and return the IR YAML path."""
+    from kfp import compiler
+
+    from .kubeflow.pipeline import ragas_evaluation_pipeline
+
+    fd, path = tempfile.mkstemp(prefix="ragas_evaluation_pipeline-", suffix=".yaml")
+    os.close(fd)
+    compiler.Compiler().compile(ragas_evaluation_pipeline, path)
+    logger.debug(f"Compiled ragas_evaluation_pipeline to {path}")
+    return path
+
 
 class EvalJob(BaseModel):
     job_id: str
     status: str
     eval_config: EvalConfig
     kubeflow_run_id: str | None = None
-    result: pd.DataFrame | None = None
+    result_path: str | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # results that could not be written to result_path are kept in memory instead
+    _result: pd.DataFrame | None = PrivateAttr(default=None)
+    # the frame last loaded from result_path, while some caller still holds it
+    _result_ref: weakref.ref | None = PrivateAttr(default=None)
+    # where a successful run's output is copied for reuse, keyed at submission time
+    _cache_uri: str | None = PrivateAttr(default=None)
+
+    @property
+    def result(self) -> pd.DataFrame | None:
+        """Evaluation results, loaded on access from the local Parquet copy when there is one.
+
+        The loaded frame is only weakly cached: repeated access while a caller
+        holds it is free, but once it's dropped the next access re-reads the file.
+        """
+        if self._result is not None:
+            return self._result
+        if self._result_ref is not None and (df := self._result_ref()) is not None:
+            return df
+        if self.result_path is not None and Path(self.result_path).exists():
+            df = _restore_list_columns(pd.read_parquet(self.result_path))
+            self._result_ref = weakref.ref(df)
+            return df
+        return None
+
 
 class PipelineRunner:
     """Execute Ragas evaluations using Kubeflow Pipelines."""
 
+    # Initialized clients shared by runners in this process, keyed by (endpoint, token digest)
+    _kfp_clients: Dict[Tuple[str, str], kfp.Client] = {}
+
     def __init__(self, kfp_config: KubeflowConfig):
         self.kfp_config = kfp_config
         self.evaluation_jobs: Dict[str, EvalJob] = {}
+        # job_id -> (fetched at, run state), coalesces bursts of job_status calls
+        self._run_states: Dict[str, Tuple[float, str]] = {}
+        self.kfp_client = self._get_kfp_client(self.kfp_config.pipelines_endpoint)
+
+    @classmethod
+    def _get_kfp_client(cls, endpoint: str) -> kfp.Client:
         try:
-            result = subprocess.run(
-                ["oc", "whoami", "-t"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5,
-            )
-            token = result.stdout.strip()
-            if not token:
-                raise RuntimeError(
-                    "No token found. Please run `oc login` and try again."
-                )
+            token = _get_token()
+            key = (endpoint, hashlib.sha256(token.encode()).hexdigest())
+            if (client := cls._kfp_clients.get(key)) is not None:
+                return client
 
-            # the kfp.Client handles the healthz endpoint poorly, run a pre-flight check manually
-            response = requests.get(
-                f"{self.kfp_config.pipelines_endpoint}/apis/v2beta1/healthz",
-                headers={
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {token}",
-                },
-                timeout=5,
-            )
+            # the kfp.Client handles the healthz endpoint poorly, run a pre-flight check manually;
+            # later calls use kfp.Client's own connection pool, so the probe's session is short-lived
+            with _create_http_session() as session:
+                response = session.get(
+                    f"{endpoint}/apis/v2beta1/healthz",
+                    headers={
+                        "Accept": "application/json",
+                        "Authorization": f"Bearer {token}",
+                    },
+                    timeout=5,
+                )
             response.raise_for_status()
 
-            self.kfp_client = kfp.Client(
-                host=self.kfp_config.pipelines_endpoint,
+            client = kfp.Client(
+                host=endpoint,
                 existing_token=token,
             )
+            cls._kfp_clients[key] = client
+            return client
         except subprocess.CalledProcessError as e:
             raise RuntimeError(
                 f"Failed to get OpenShift token. Command failed with exit code {e.returncode}: {e.stderr.strip()}"
             ) from e
         except requests.exceptions.RequestException as e:
             raise RuntimeError(
-                f"Failed to connect to Kubeflow Pipelines server at {self.kfp_config.pipelines_endpoint}, "
+                f"Failed to connect to Kubeflow Pipelines server at {endpoint}, "
                 "do you need a new token?"
             ) from e
         except Exception as e:
             raise RuntimeError("Failed to initialize Kubeflow Pipelines client.") from e
 
-    def run_eval(self, eval_config: EvalConfig) -> EvalJob:
+    def run_eval(
+        self,
+        eval_config: EvalConfig,
+        reuse_cached: bool = False,
+        store_cached: bool = False,
+    ) -> EvalJob:
+        """Submit an evaluation run.
+
+        With ``store_cached``, the output of a successful run is also copied to
+        ``<output dir>/.ragas-cache/`` for later reuse. With ``reuse_cached``, an
+        identical evaluation stored that way (same config apart from
+        ``output_dataset_uri``, same version of the input dataset) is answered
+        from its copy instead of running the pipeline again. Both are off by
+        default: the cache can't tell that the model behind ``inference_url``
+        changed, and sampled runs aren't deterministic.
+        """
         job_id = str(uuid.uuid4())
+        cache_uri = (
+            self._result_cache_uri(eval_config) if reuse_cached or store_cached else None
+        )
+        if reuse_cached and cache_uri and (
+            job := self._job_from_result_cache(job_id, eval_config, cache_uri)
+        ):
+            self.evaluation_jobs[job_id] = job
+            logger.warning(
+                f"Job {job_id} was not submitted to Kubeflow: returning cached results of an "
+                f"earlier identical evaluation from {cache_uri} (pass reuse_cached=False to rerun)"
+            )
+            return job
+
         job = EvalJob(job_id=job_id, status="submitted", eval_config=eval_config)
+        if store_cached:
+            job._cache_uri = cache_uri
 
         kubeflow_run_id = self._submit_to_kubeflow(
             eval_config=eval_config, job_id=job_id
@@ -88,9 +273,69 @@ class PipelineRunner:
 
         return job
 
-    def _submit_to_kubeflow(self, eval_config: EvalConfig, job_id: str) -> str:
-        from .kubeflow.pipeline import ragas_evaluation_pipeline
+    @staticmethod
+    def _result_cache_uri(eval_config: EvalConfig) -> str | None:
+        """Where the output of an evaluation with this config is kept for reuse.
+
+        Keyed by a digest of the config and the input dataset's current version
+        (ETag, version id or modification time), so overwriting the dataset in
+        place misses the cache. Results are cached next to the output dataset,
+        under ``.ragas-cache/``. None when the input's version can't be read.
+        """
+        import fsspec
 
+        try:
+            fs, path = fsspec.core.url_to_fs(eval_config.input_dataset_uri)
+            info = fs.info(path)
+        except Exception as e:
+            logger.debug(f"Cannot version {eval_config.input_dataset_uri}, not caching: {e}")
+            return None
+        input_version = next(
+            (str(info[key]) for key in ("ETag", "VersionId", "mtime", "LastModified") if info.get(key)),
+            None,
+        )
+        if input_version is None:
+            return None
+
+        config = eval_config.model_dump(mode="json", exclude={"output_dataset_uri"})
+        config["input_dataset_version"] = input_version
+        digest = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        output_dir = eval_config.output_dataset_uri.rsplit("/", 1)[0]
+        return f"{output_dir}/.ragas-cache/{digest}.jsonl"
+
+    def _job_from_result_cache(
+        self, job_id: str, eval_config: EvalConfig, cache_uri: str
+    ) -> EvalJob | None:
+        import fsspec
+
+        try:
+            fs, path = fsspec.core.url_to_fs(cache_uri)
+            if not fs.exists(path):
+                return None
+        except Exception as e:
+            logger.debug(f"Result cache lookup failed for {cache_uri}: {e}")
+            return None
+        return EvalJob(
+            job_id=job_id,
+            status="completed",
+            eval_config=eval_config.model_copy(update={"output_dataset_uri": cache_uri}),
+        )
+
+    def _store_in_result_cache(self, job: EvalJob) -> None:
+        if (cache_uri := job._cache_uri) is None:
+            return  # caching wasn't requested for this job
+        import fsspec
+
+        output_uri = job.eval_config.output_dataset_uri
+        try:
+            fs, path = fsspec.core.url_to_fs(output_uri)
+            fs.copy(path, fsspec.core.url_to_fs(cache_uri)[1])
+        except Exception as e:
+            logger.debug(f"Could not cache results of job {job.job_id}: {e}")
+
+    def _submit_to_kubeflow(self, eval_config: EvalConfig, job_id: str) -> str:
         sampling_params = {
             "temperature": eval_config.model_params["temperature"],
             "max_tokens": eval_config.model_params["max_tokens"],
@@ -105,9 +350,13 @@ class PipelineRunner:
             "input_dataset_uri": eval_config.input_dataset_uri,
             "output_dataset_uri": eval_config.output_dataset_uri,
         }
+        # unset values fall back to the pipeline defaults
+        for key in ("max_workers", "batch_size"):
+            if (value := getattr(eval_config.ragas_config, key)) is not None:
+                pipeline_args[key] = value
 
-        run_result = self.kfp_client.create_run_from_pipeline_func(
-            pipeline_func=ragas_evaluation_pipeline,
+        run_result = self.kfp_client.create_run_from_pipeline_package(
+            pipeline_file=_compiled_pipeline_package(),
             arguments=pipeline_args,
             run_name=f"ragas-eval-run-{job_id}",
             namespace=self.kfp_config.namespace,
@@ -118,10 +367,12 @@ class PipelineRunner:
 
     def _fetch_kubeflow_results(self, job: EvalJob) -> pd.DataFrame:
         """Fetch results directly from S3."""
+        if (result := job.result) is not None:
+            return result
         s3_url = job.eval_config.output_dataset_uri
 
         try:
-            df = pd.read_json(s3_url, lines=True)
+            df, cache_file = self._read_results(s3_url, job.eval_config.metric_names)
             logger.info(f"Successfully fetched results from {s3_url}")
         except Exception as e:
             raise RuntimeError(
@@ -130,9 +381,53 @@ class PipelineRunner:
         else:
             table_output = render_dataframe_as_table(df, "Fetched Evaluation Results")
             logger.info(f"Fetched Evaluation Results:\n{table_output}")
-            job.result = df
+            # keep a path rather than the frame, so finished jobs don't pin their results in memory
+            if cache_file is not None:
+                job.result_path = str(cache_file)
+            else:
+                job._result = df
             return df
 
+    @staticmethod
+    def _read_results(
+        s3_url: str, metric_names: List[str]
+    ) -> Tuple[pd.DataFrame, Path | None]:
+        """Read a results JSONL, reusing a local Parquet copy while its ETag is unchanged.
+
+        Metric columns are coerced to float64 so integer-looking, null or non-numeric
+        scores can't turn them into int64 or object columns; columns keep the file's order.
+        Returns the frame and the Parquet copy's path (None if it couldn't be written).
+        """
+        import fsspec
+        import pyarrow.json as paj
+
+        fs, path = fsspec.core.url_to_fs(s3_url)
+        etag = str(fs.info(path).get("ETag") or "").strip('"')
+        cache_file = _RESULTS_CACHE_DIR / f"{etag}.parquet" if etag else None
+        if cache_file is not None and cache_file.exists():
+            cache_file.touch()  # mark as recently used for _prune_results_cache
+            return _restore_list_columns(pd.read_parquet(cache_file)), cache_file
+
+        # Arrow's JSON reader is multithreaded C++ and fills contiguous columns directly
+        with fs.open(path, "rb") as f:
+            table = paj.read_json(f, read_options=paj.ReadOptions(use_threads=True, block_size=8 << 20))
+        df = _restore_list_columns(table.to_pandas(split_blocks=True, self_destruct=True))
+        del table
+        for name in metric_names:
+            if name in df.columns:
+                df[name] = pd.to_numeric(df[name], errors="coerce").astype("float64")
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cache_file.with_suffix(".tmp")
+                df.to_parquet(tmp)
+                tmp.replace(cache_file)
+                _prune_results_cache()
+            except Exception as e:
+                logger.debug(f"Could not cache results for {s3_url}: {e}")
+                cache_file = None
+        return df, cache_file
+
     def job_cancel(self, job_id: str) -> None:
         """Cancel a running Kubeflow pipeline."""
         if (job := self.evaluation_jobs.get(job_id)) is None:
@@ -151,29 +446,199 @@ class PipelineRunner:
     def job_status(self, job_id: str) -> EvalJob:
         if (job := self.evaluation_jobs.get(job_id)) is None:
             raise RuntimeError(f"Job {job_id} not found")
+        if job.kubeflow_run_id is None:
+            return job  # answered from the result cache, no run to query
+        if job.status in ("completed", "failed", "cancelled"):
+            return job  # terminal, the run can't change any more
+
+        cached = self._run_states.get(job_id)
+        if cached is not None and time.monotonic() - cached[0] < _RUN_STATE_TTL_SECONDS:
+            return job
 
         try:
             run_detail = self.kfp_client.get_run(job.kubeflow_run_id)
-            if run_detail.state == "FAILED":
-                job.status = "failed"
-            elif run_detail.state == "SUCCEEDED":
-                job.status = "completed"
-                self._fetch_kubeflow_results(job)
-            elif run_detail.state == "RUNNING" or run_detail.state == "PENDING":
-                job.status = "in_progress"
-            else:
-                raise RuntimeError(f"Unknown Kubeflow run state: {run_detail.state}")
+            self._run_states[job_id] = (time.monotonic(), run_detail.state)
+            self._apply_run_state(job, run_detail.state)
         except Exception as e:
             logger.error(f"Failed to get job status: {str(e)}")
 
         return job
 
+    def _apply_run_state(self, job: EvalJob, state: str) -> None:
+        if state == "SUCCEEDED":
+            if job.status != "completed":
+                self._store_in_result_cache(job)
+            job.status = "completed"
+            self._fetch_kubeflow_results(job)
+        elif state in ("RUNNING", "PENDING", "PAUSED", "RUNTIME_STATE_UNSPECIFIED", None):
+            job.status = "in_progress"
+        elif state in ("CANCELED", "CANCELING"):
+            job.status = "cancelled"
+        else:
+            # FAILED, SKIPPED or a state this client doesn't know: finished without results
+            if state != "FAILED":
+                logger.warning(f"Job {job.job_id}: Kubeflow run ended in state {state}, marking it failed")
+            job.status = "failed"
+
+    def _list_runs_by_id(self, run_ids: List[str]) -> List:
+        """Fetch the given runs with ``list_runs``, following every page.
+
+        Run ids are sent in chunks so the filter stays small, and each chunk is
+        paged until ``next_page_token`` is empty since the API server caps
+        ``page_size``.
+        """
+        runs = []
+        for start in range(0, len(run_ids), _LIST_RUNS_CHUNK):
+            chunk = run_ids[start : start + _LIST_RUNS_CHUNK]
+            run_filter = json.dumps({
+                "predicates": [{
+                    "key": "run_id",
+                    "operation": "IN",
+                    "string_values": {"values": chunk},
+                }]
+            })
+            page_token = ""
+            while True:
+                response = self.kfp_client.list_runs(
+                    page_token=page_token,
+                    page_size=len(chunk),
+                    filter=run_filter,
+                    namespace=self.kfp_config.namespace,
+                )
+                runs.extend(response.runs or [])
+                if not (page_token := response.next_page_token):
+                    break
+        return runs
+
+    def wait_for_many(
+        self,
+        job_ids: List[str],
+        max_interval: float = 30.0,
+        timeout: float | None = None,
+    ) -> Dict[str, EvalJob]:
+        """Wait for several jobs from one loop.
+
+        Each poll refreshes every still-running job with ``list_runs`` (one
+        request per page), so N evaluations cost one waiter rather than N.
+        Backs off like ``wait_for_completion``. With ``timeout``, returns after
+        that many seconds even if some jobs are still running.
+        """
+        jobs: Dict[str, EvalJob] = {}
+        for job_id in job_ids:
+            if (job := self.evaluation_jobs.get(job_id)) is None:
+                raise RuntimeError(f"Job {job_id} not found")
+            jobs[job_id] = job
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = 2.0
+        while pending := {
+            job.kubeflow_run_id: job
+            for job in jobs.values()
+            if job.kubeflow_run_id and job.status in ("submitted", "in_progress")
+        }:
+            try:
+                for run_detail in self._list_runs_by_id(list(pending)):
+                    if (job := pending.get(run_detail.run_id)) is not None:
+                        try:
+                            self._apply_run_state(job, run_detail.state)
+                        except Exception as e:
+                            logger.error(f"Failed to update job {job.job_id}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Failed to get job statuses: {str(e)}")
+
+            if any(job.status in ("submitted", "in_progress") for job in pending.values()):
+                if deadline is not None and time.monotonic() + interval > deadline:
+                    logger.warning(f"Timed out waiting for {len(pending)} job(s)")
+                    break
+                time.sleep(interval)
+                interval = min(interval * 1.5, max_interval) + random.uniform(0, 1)
+        return jobs
+
+    def wait_for_completion(
+        self,
+        job_id: str,
+        max_interval: float = 30.0,
+        watch: bool = True,
+        timeout: float | None = None,
+    ) -> EvalJob:
+        """Block until the job leaves the submitted/in-progress states.
+
+        With ``watch`` the Argo Workflow behind the run is watched through the
+        Kubernetes API in short windows, checking the run through KFP between
+        them, so the call wakes on the state change instead of on the next
+        poll even if the watch never sees the workflow. If the watch isn't
+        possible (no kubeconfig, no RBAC to list workflows) it falls back to
+        polling.
+
+        Polls quickly at first and backs off towards ``max_interval`` (with a
+        little jitter so concurrent waiters don't poll in lockstep), so short
+        evaluations return promptly without hammering the KFP API on long ones.
+        With ``timeout``, returns after that many seconds even if the job is
+        still running.
+        """
+        job = self.job_status(job_id)
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        interval = 2.0
+        while job.status in ("submitted", "in_progress"):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                logger.warning(f"Timed out waiting for job {job_id} after {timeout}s")
+                break
+
+            if watch:
+                window = _WATCH_WINDOW_SECONDS
+                if remaining is not None:
+                    window = max(1, min(window, int(remaining)))
+                window_started = time.monotonic()
+                try:
+                    if self._watch_workflow(job.kubeflow_run_id, timeout_seconds=window):
+                        self._run_states.pop(job_id, None)  # state just changed, don't serve the cached one
+                        watch = False  # poll out any lag until KFP reports the run finished
+                    elif time.monotonic() - window_started < 1:
+                        raise RuntimeError("watch closed immediately")
+                except Exception as e:
+                    logger.info(f"Cannot watch run {job.kubeflow_run_id}, polling instead: {e}")
+                    watch = False
+            else:
+                time.sleep(interval if remaining is None else min(interval, remaining))
+                interval = min(interval * 1.5, max_interval) + random.uniform(0, 1)
+
+            job = self.job_status(job_id)
+            logger.info(
+                f"Job {job_id}: {job.status} (elapsed: {time.monotonic() - started:.0f}s)"
+            )
+        return job
+
+    def _watch_workflow(self, run_id: str, timeout_seconds: int = _WATCH_WINDOW_SECONDS) -> bool:
+        """Watch the Argo Workflow for ``run_id`` for up to ``timeout_seconds``.
+
+        Returns True once it reaches a terminal phase, False if the window ends first.
+        """
+        from kubernetes import watch
+
+        watcher = watch.Watch()
+        for event in watcher.stream(
+            _custom_objects_api().list_namespaced_custom_object,
+            group="argoproj.io",
+            version="v1alpha1",
+            namespace=self.kfp_config.namespace,
+            plural="workflows",
+            label_selector=f"pipeline/runid={run_id}",
+            timeout_seconds=timeout_seconds,
+        ):
+            phase = (event["object"].get("status") or {}).get("phase")
+            if phase in ("Succeeded", "Failed", "Error"):
+                watcher.stop()
+                return True
+        return False
+
     def job_result(self, job_id: str) -> pd.DataFrame | None:
         if (job := self.evaluation_jobs.get(job_id)) is None:
             raise RuntimeError(f"Job {job_id} not found")
 
         if job.status == "completed":
-            return job.result
+            return self._fetch_kubeflow_results(job)
         elif job.status == "failed":
             raise RuntimeError(f"Job {job_id} failed")
         else: